@@ -6,9 +6,18 @@ Fixed terms, exact matches, no inference.
 v0.1.0
 """
 
+import functools
+import operator
+import sys
 from types import MappingProxyType
 
 
+@functools.lru_cache(maxsize=None)
+def _build_frozen(cls, items: tuple):
+    """Build and cache one lexicon per (class, ordered items) pair."""
+    return cls(dict(items))
+
+
 class DeterministicLexicon:
     """A frozen, deterministic vocabulary.
 
@@ -17,6 +26,8 @@ class DeterministicLexicon:
     All lookups are exact-match, O(1), no fallbacks.
     """
 
+    __slots__ = ("_raw", "_terms", "_ids", "__weakref__")
+
     def __init__(self, terms: dict) -> None:
         """Build lexicon from a dict of {term: definition} pairs.
 
@@ -50,17 +61,66 @@ class DeterministicLexicon:
                     f"Strip-collision: '{key}' normalises to '{stripped_key}' "
                     f"which already exists"
                 )
-            normalised[stripped_key] = stripped_value
+            normalised[sys.intern(stripped_key)] = stripped_value
+
+        # Lookups go straight to the bare dict via `in` and subscripting,
+        # which the interpreter specialises (calling bound __contains__ /
+        # __getitem__ methods is slower). The public views go through the
+        # read-only proxy. Neither attribute can be rebound afterwards.
+        object.__setattr__(self, "_raw", normalised)
+        object.__setattr__(self, "_terms", MappingProxyType(normalised))
+
+    def __setattr__(self, name, value) -> None:
+        raise AttributeError("DeterministicLexicon is immutable")
+
+    def __delattr__(self, name) -> None:
+        raise AttributeError("DeterministicLexicon is immutable")
+
+    def __copy__(self) -> "DeterministicLexicon":
+        # Immutable, so a copy is the instance itself.
+        return self
+
+    def __deepcopy__(self, memo) -> "DeterministicLexicon":
+        return self
+
+    @classmethod
+    def frozen(cls, terms: dict) -> "DeterministicLexicon":
+        """Return a shared lexicon for terms from a process-wide cache.
 
-        self._terms = MappingProxyType(normalised)
+        Calls with equal (term, definition) pairs in the same order return
+        the cached instance. Order is part of the key because it fixes term
+        ids. Failed builds are not cached. Concurrent first calls for the
+        same terms may each build an instance; later calls get the cached
+        one.
+
+        The cache is unbounded: every distinct input stays alive for the
+        life of the process, so use this only for a fixed set of constant
+        lexicons, not per-request data.
+
+        Raises ValueError under the same rules as the constructor.
+        """
+        if not isinstance(terms, dict):
+            raise ValueError("terms must be a dict")
+        key = tuple(terms.items())
+        try:
+            hash(key)
+        except TypeError:
+            # Unhashable values cannot be cache keys; the constructor
+            # rejects them with the usual ValueError.
+            return cls(terms)
+        return _build_frozen(cls, key)
 
     def has(self, term: str) -> bool:
         """Return True if term exists in the lexicon, False otherwise.
 
         Raises ValueError for non-string or empty/whitespace-only input.
         """
-        self._validate_term_input(term)
-        return term.strip() in self._terms
+        if not isinstance(term, str):
+            raise ValueError(f"Term must be str, got {type(term).__name__}")
+        stripped = term.strip()
+        if not stripped:
+            raise ValueError("Term must not be empty or whitespace-only")
+        return stripped in self._raw
 
     def get(self, term: str) -> str:
         """Return the definition for the given term.
@@ -68,11 +128,27 @@ class DeterministicLexicon:
         Raises ValueError for non-string or empty/whitespace-only input.
         Raises KeyError if the term does not exist.
         """
-        self._validate_term_input(term)
+        if not isinstance(term, str):
+            raise ValueError(f"Term must be str, got {type(term).__name__}")
         stripped = term.strip()
-        if stripped not in self._terms:
-            raise KeyError(stripped)
-        return self._terms[stripped]
+        if not stripped:
+            raise ValueError("Term must not be empty or whitespace-only")
+        return self._raw[stripped]
+
+    def try_get(self, term: str, default=None):
+        """Return the definition for the given term, or default if absent.
+
+        For callers that expect misses: no KeyError is raised for unknown
+        terms, but input is validated exactly as in get().
+
+        Raises ValueError for non-string or empty/whitespace-only input.
+        """
+        if not isinstance(term, str):
+            raise ValueError(f"Term must be str, got {type(term).__name__}")
+        stripped = term.strip()
+        if not stripped:
+            raise ValueError("Term must not be empty or whitespace-only")
+        return self._raw.get(stripped, default)
 
     def validate(self, term: str) -> str:
         """Validate that a term exists and return it normalised.
@@ -80,12 +156,78 @@ class DeterministicLexicon:
         Raises ValueError for non-string or empty/whitespace-only input.
         Raises KeyError if the term does not exist.
         """
-        self._validate_term_input(term)
+        if not isinstance(term, str):
+            raise ValueError(f"Term must be str, got {type(term).__name__}")
         stripped = term.strip()
-        if stripped not in self._terms:
+        if not stripped:
+            raise ValueError("Term must not be empty or whitespace-only")
+        if stripped not in self._raw:
             raise KeyError(stripped)
         return stripped
 
+    def validate_id(self, term: str) -> int:
+        """Validate that a term exists and return its integer id.
+
+        Ids are positions in construction order and are stable for the
+        lifetime of the instance. Use with get_by_id() / term_by_id().
+
+        Raises ValueError for non-string or empty/whitespace-only input.
+        Raises KeyError if the term does not exist.
+        """
+        if not isinstance(term, str):
+            raise ValueError(f"Term must be str, got {type(term).__name__}")
+        stripped = term.strip()
+        if not stripped:
+            raise ValueError("Term must not be empty or whitespace-only")
+        return self._id_tables()[2][stripped]
+
+    def get_by_id(self, term_id: int) -> str:
+        """Return the definition for an id from validate_id().
+
+        Raises ValueError for non-integer (or bool) input.
+        Raises KeyError if the id is out of range.
+        """
+        term_id = self._normalise_id(term_id)
+        definitions = self._id_tables()[1]
+        if not 0 <= term_id < len(definitions):
+            raise KeyError(term_id)
+        return definitions[term_id]
+
+    def term_by_id(self, term_id: int) -> str:
+        """Return the normalised term for an id from validate_id().
+
+        Raises ValueError for non-integer (or bool) input.
+        Raises KeyError if the id is out of range.
+        """
+        term_id = self._normalise_id(term_id)
+        terms = self._id_tables()[0]
+        if not 0 <= term_id < len(terms):
+            raise KeyError(term_id)
+        return terms[term_id]
+
+    def has_many(self, terms) -> list:
+        """Return has() for each term in an iterable, in order.
+
+        Raises ValueError if terms is a str or not iterable, or for any
+        non-string or empty/whitespace-only term.
+        """
+        if isinstance(terms, str):
+            raise ValueError("terms must be an iterable of terms, not a str")
+        raw = self._raw
+        return [key in raw for key in self._normalise_terms(terms)]
+
+    def get_many(self, terms) -> list:
+        """Return get() for each term in an iterable, in order.
+
+        Raises ValueError if terms is a str or not iterable, or for any
+        non-string or empty/whitespace-only term.
+        Raises KeyError for the first term that does not exist.
+        """
+        if isinstance(terms, str):
+            raise ValueError("terms must be an iterable of terms, not a str")
+        raw = self._raw
+        return [raw[key] for key in self._normalise_terms(terms)]
+
     def items(self):
         """Return all (term, definition) pairs."""
         return self._terms.items()
@@ -98,10 +240,62 @@ class DeterministicLexicon:
         """Return all definitions."""
         return self._terms.values()
 
+    def _id_tables(self) -> tuple:
+        """Return (terms, definitions, term -> id index), built on first use.
+
+        Ids are positions in construction order. The tables are built
+        lazily so lexicons that never use ids carry no second hash table;
+        racing first calls build identical tables.
+        """
+        try:
+            return self._ids
+        except AttributeError:
+            terms = tuple(self._raw)
+            ids = (terms, tuple(self._raw.values()), {term: i for i, term in enumerate(terms)})
+            object.__setattr__(self, "_ids", ids)
+            return ids
+
     @staticmethod
-    def _validate_term_input(term) -> None:
-        """Check that a lookup term is a non-empty string."""
+    def _normalise_terms(terms) -> list:
+        """Strip a batch of lookup terms, with the same checks as a single term.
+
+        Strips everything in one C-level map(str.strip) pass; only when that
+        hits a non-str element is the batch re-checked term by term to raise
+        the usual ValueError.
+        """
+        try:
+            iterator = iter(terms)
+        except TypeError:
+            raise ValueError(f"terms must be an iterable of terms, got {type(terms).__name__}") from None
+        terms = list(iterator)
+        try:
+            stripped = list(map(str.strip, terms))
+        except TypeError:
+            stripped = list(map(DeterministicLexicon._normalise_term, terms))
+        if not all(stripped):
+            raise ValueError("Term must not be empty or whitespace-only")
+        return stripped
+
+    @staticmethod
+    def _normalise_id(term_id) -> int:
+        """Check that a term id is an integer (not bool) and return it as int.
+
+        Accepts int subclasses such as IntEnum members and other integer
+        types that implement __index__ (e.g. NumPy integers).
+        """
+        if isinstance(term_id, bool):
+            raise ValueError("Term id must be int, got bool")
+        try:
+            return operator.index(term_id)
+        except TypeError:
+            raise ValueError(f"Term id must be int, got {type(term_id).__name__}") from None
+
+    @staticmethod
+    def _normalise_term(term) -> str:
+        """Check that a lookup term is a non-empty string and strip it."""
         if not isinstance(term, str):
             raise ValueError(f"Term must be str, got {type(term).__name__}")
-        if term.strip() == "":
+        stripped = term.strip()
+        if not stripped:
             raise ValueError("Term must not be empty or whitespace-only")
+        return stripped
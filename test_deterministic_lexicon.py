@@ -4,6 +4,10 @@ Comprehensive tests for DeterministicLexicon.
 Covers all paths, failure modes, and edge cases.
 """
 
+import copy
+import enum
+import weakref
+
 import pytest
 from deterministic_lexicon import DeterministicLexicon
 
@@ -52,6 +56,20 @@ def test_get_unknown_raises_key_error(lexicon):
         lexicon.get("UNKNOWN")
 
 
+def test_try_get_known_term(lexicon):
+    assert lexicon.try_get(" ALLOW ") == "Permission to proceed"
+
+
+def test_try_get_unknown_returns_default(lexicon):
+    assert lexicon.try_get("UNKNOWN") is None
+    assert lexicon.try_get("UNKNOWN", "n/a") == "n/a"
+
+
+def test_try_get_bad_term_raises_value_error(lexicon):
+    with pytest.raises(ValueError):
+        lexicon.try_get("")
+
+
 # ── validate() happy paths ───────────────────────────────
 
 def test_validate_known_term(lexicon):
@@ -67,6 +85,86 @@ def test_validate_unknown_raises_key_error(lexicon):
         lexicon.validate("NOPE")
 
 
+# ── Integer ids ──────────────────────────────────────────
+
+def test_validate_id_round_trips(lexicon):
+    term_id = lexicon.validate_id(" HOLD ")
+    assert lexicon.term_by_id(term_id) == "HOLD"
+    assert lexicon.get_by_id(term_id) == "Awaiting further input"
+
+
+def test_ids_follow_construction_order(lexicon):
+    assert [lexicon.validate_id(term) for term in SAMPLE_TERMS] == [0, 1, 2, 3]
+
+
+def test_validate_id_unknown_raises_key_error(lexicon):
+    with pytest.raises(KeyError):
+        lexicon.validate_id("NOPE")
+
+
+def test_out_of_range_id_raises_key_error(lexicon):
+    with pytest.raises(KeyError):
+        lexicon.get_by_id(4)
+    with pytest.raises(KeyError):
+        lexicon.term_by_id(-1)
+
+
+def test_int_subclass_id_is_accepted(lexicon):
+    class Slot(enum.IntEnum):
+        HOLD = 2
+
+    assert lexicon.get_by_id(Slot.HOLD) == "Awaiting further input"
+    assert lexicon.term_by_id(Slot.HOLD) == "HOLD"
+
+
+def test_non_int_id_raises_value_error(lexicon):
+    with pytest.raises(ValueError):
+        lexicon.get_by_id("0")
+    with pytest.raises(ValueError):
+        lexicon.term_by_id(True)
+    with pytest.raises(ValueError):
+        lexicon.get_by_id(1.0)
+
+
+# ── Bulk lookups ─────────────────────────────────────────
+
+def test_has_many(lexicon):
+    assert lexicon.has_many(["ALLOW", " DENY ", "NOPE"]) == [True, True, False]
+
+
+def test_get_many(lexicon):
+    assert lexicon.get_many(iter(["HALT", " HOLD "])) == [
+        "Immediate stop",
+        "Awaiting further input",
+    ]
+
+
+def test_get_many_unknown_raises_key_error(lexicon):
+    with pytest.raises(KeyError):
+        lexicon.get_many(["ALLOW", "NOPE"])
+
+
+def test_many_bad_term_raises_value_error(lexicon):
+    with pytest.raises(ValueError):
+        lexicon.has_many(["ALLOW", None])
+    with pytest.raises(ValueError):
+        lexicon.get_many(["ALLOW", "   "])
+
+
+def test_many_bare_string_raises_value_error(lexicon):
+    with pytest.raises(ValueError):
+        lexicon.has_many("ALLOW")
+    with pytest.raises(ValueError):
+        lexicon.get_many("AB")
+
+
+def test_many_non_iterable_raises_value_error(lexicon):
+    with pytest.raises(ValueError):
+        lexicon.has_many(None)
+    with pytest.raises(ValueError):
+        lexicon.get_many(5)
+
+
 # ── Term hygiene (strip + empty + type) ──────────────────
 
 def test_empty_string_raises_value_error(lexicon):
@@ -89,6 +187,22 @@ def test_int_term_raises_value_error(lexicon):
         lexicon.get(123)
 
 
+def test_unicode_whitespace_is_stripped(lexicon):
+    assert lexicon.validate("\u00a0ALLOW\u3000") == "ALLOW"
+
+
+class Verdict(str, enum.Enum):
+    ALLOW = "ALLOW"
+    NOPE = "NOPE"
+
+
+def test_str_subclass_term_is_accepted(lexicon):
+    assert lexicon.has(Verdict.ALLOW) is True
+    assert lexicon.has(Verdict.NOPE) is False
+    assert lexicon.get(Verdict.ALLOW) == "Permission to proceed"
+    assert lexicon.validate(Verdict.ALLOW) == "ALLOW"
+
+
 def test_validate_empty_raises_value_error(lexicon):
     with pytest.raises(ValueError):
         lexicon.validate("")
@@ -131,6 +245,16 @@ def test_strip_collision_raises_value_error():
         DeterministicLexicon({"ALLOW": "first", " ALLOW ": "second"})
 
 
+def test_str_subclass_keys_and_values_accepted():
+    lex = DeterministicLexicon({Verdict.ALLOW: Verdict.NOPE})
+    assert lex.get("ALLOW") == "NOPE"
+
+
+def test_collision_reported_before_later_empty_value():
+    with pytest.raises(ValueError, match="Strip-collision"):
+        DeterministicLexicon({"A": "x", " A": "y", "B": "  "})
+
+
 # ── Immutability via MappingProxyType ────────────────────
 
 def test_cannot_assign_to_internal_terms(lexicon):
@@ -143,6 +267,29 @@ def test_cannot_delete_from_internal_terms(lexicon):
         del lexicon._terms["ALLOW"]
 
 
+def test_cannot_rebind_internal_attributes(lexicon):
+    with pytest.raises(AttributeError):
+        lexicon._raw = {"NEW": "injected"}
+    with pytest.raises(AttributeError):
+        lexicon._terms = {}
+    with pytest.raises(AttributeError):
+        del lexicon._raw
+
+
+def test_no_per_instance_dict(lexicon):
+    assert not hasattr(lexicon, "__dict__")
+
+
+def test_copy_returns_same_instance(lexicon):
+    assert copy.copy(lexicon) is lexicon
+    assert copy.deepcopy(lexicon) is lexicon
+
+
+def test_supports_weak_references(lexicon):
+    ref = weakref.ref(lexicon)
+    assert ref() is lexicon
+
+
 # ── Determinism ──────────────────────────────────────────
 
 def test_same_input_same_output():
@@ -165,6 +312,43 @@ def test_independent_instances_no_leakage():
     assert lex_b.has("X") is False
 
 
+# ── Shared frozen instances ──────────────────────────────
+
+def test_frozen_returns_same_instance():
+    lex = DeterministicLexicon.frozen(SAMPLE_TERMS)
+    assert DeterministicLexicon.frozen(dict(SAMPLE_TERMS)) is lex
+    assert lex.get("ALLOW") == "Permission to proceed"
+
+
+def test_frozen_order_is_part_of_the_key():
+    reordered = dict(reversed(list(SAMPLE_TERMS.items())))
+    lex = DeterministicLexicon.frozen(reordered)
+    assert lex is not DeterministicLexicon.frozen(SAMPLE_TERMS)
+    assert lex.validate_id("HALT") == 0
+
+
+def test_frozen_bad_input_raises_value_error():
+    with pytest.raises(ValueError):
+        DeterministicLexicon.frozen({"KEY": "   "})
+    with pytest.raises(ValueError):
+        DeterministicLexicon.frozen({"KEY": ["unhashable"]})
+    with pytest.raises(ValueError):
+        DeterministicLexicon.frozen([("KEY", "value")])
+
+
+def test_frozen_does_not_retry_failed_construction():
+    calls = []
+
+    class Broken(DeterministicLexicon):
+        def __init__(self, terms):
+            calls.append(terms)
+            raise TypeError("boom")
+
+    with pytest.raises(TypeError):
+        Broken.frozen({"KEY": "value"})
+    assert len(calls) == 1
+
+
 # ── items/keys/values ────────────────────────────────────
 
 def test_keys_returns_all_terms(lexicon):